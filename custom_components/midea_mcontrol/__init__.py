@@ -5,13 +5,14 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_SCAN_INTERVAL, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
 
 from .aircontrolbase import AirControlBaseApi, LocalApi
 from .const import CONF_EMAIL, CONF_HOST, CONF_PASSWORD, DOMAIN
-from .coordinator import MideaMControlCoordinator
+from .coordinator import CLOUD_CACHE_REFRESH_INTERVAL, MideaMControlCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,9 +29,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         session=session,
     )
 
-    # Login to cloud
-    await cloud_api.login()
-
     # Set up local API if host is configured
     local_api: LocalApi | None = None
     host = entry.data.get(CONF_HOST)
@@ -38,9 +36,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         local_api = LocalApi(host=host, session=session)
         _LOGGER.info("Local CCM21-i polling enabled at %s", host)
 
-    coordinator = MideaMControlCoordinator(hass, cloud_api, local_api)
+    coordinator = MideaMControlCoordinator(
+        hass,
+        cloud_api,
+        local_api,
+        scan_interval=entry.options.get(CONF_SCAN_INTERVAL),
+    )
 
-    # Initial cloud fetch (discovers devices and builds addr mapping)
+    # Initial cloud fetch (discovers devices and builds addr mapping). The
+    # cloud login happens on the first call, overlapping the local fetch.
     initial_data = await coordinator.async_initial_cloud_fetch()
     coordinator.async_set_updated_data(initial_data)
 
@@ -49,9 +53,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # With local polling, cloud metadata is refreshed on a separate slow timer
+    if local_api:
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                coordinator.async_refresh_cloud_cache,
+                CLOUD_CACHE_REFRESH_INTERVAL,
+            )
+        )
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -2,65 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 from .const import (
     BASE_URL,
+    CONTROL_BATCH_SECONDS,
     CONTROL_PATH,
     DETAILS_PATH,
-    LOCAL_FAN_AUTO,
-    LOCAL_FAN_HIGH,
-    LOCAL_FAN_LOW,
-    LOCAL_FAN_MEDIUM,
-    LOCAL_FAN_OFF,
-    LOCAL_MODE_AUTO,
-    LOCAL_MODE_COOL,
-    LOCAL_MODE_DRY,
-    LOCAL_MODE_FAN,
-    LOCAL_MODE_HEAT,
+    LOCAL_FAN_TO_CLOUD,
     LOCAL_MODE_OFF,
+    LOCAL_MODE_TO_CLOUD,
     LOCAL_STATUS_ENDPOINT,
     LOGIN_PATH,
-    MODE_AUTO,
-    MODE_COOL,
-    MODE_DRY,
-    MODE_FAN,
-    MODE_HEAT,
     POWER_OFF,
     POWER_ON,
     SESSION_EXPIRED_CODE,
-    WIND_AUTO,
-    WIND_HIGH,
-    WIND_LOW,
-    WIND_MID,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Map local integer modes to cloud string modes
-LOCAL_MODE_TO_CLOUD = {
-    LOCAL_MODE_COOL: MODE_COOL,
-    LOCAL_MODE_HEAT: MODE_HEAT,
-    LOCAL_MODE_DRY: MODE_DRY,
-    LOCAL_MODE_FAN: MODE_FAN,
-    LOCAL_MODE_OFF: None,  # Off is represented by power="n"
-    LOCAL_MODE_AUTO: MODE_AUTO,
+# Per-request timeout for the local gateway (the shared HA session has none
+# this short, and a slow CCM21-i must not stall the 5s poll cycle)
+_LOCAL_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Full cloud endpoint URLs, keyed by path
+_CLOUD_URLS = {
+    path: BASE_URL + path for path in (LOGIN_PATH, DETAILS_PATH, CONTROL_PATH)
 }
 
-# Map local integer fan to cloud string fan
-LOCAL_FAN_TO_CLOUD = {
-    LOCAL_FAN_AUTO: WIND_AUTO,
-    LOCAL_FAN_LOW: WIND_LOW,
-    LOCAL_FAN_MEDIUM: WIND_MID,
-    LOCAL_FAN_HIGH: WIND_HIGH,
-    LOCAL_FAN_OFF: WIND_AUTO,
+# Headers sent with every cloud request (aiohttp copies them per request)
+_JSON_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Connection": "keep-alive",
 }
 
+# orjson is only used for parsing; control payloads keep json.dumps output
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Cloud power and swing values, indexed by the local boolean flags
+_POWER_BY_FLAG = (POWER_OFF, POWER_ON)
+_SWING_BY_FLAG = ("0", "1")
+
 
 class AirControlBaseApiError(Exception):
     """Base exception for API errors."""
@@ -70,7 +65,7 @@ class AuthenticationError(AirControlBaseApiError):
     """Authentication failed."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LocalDeviceState:
     """Parsed state of one AC unit from local CCM21-i hex data."""
 
@@ -82,70 +77,126 @@ class LocalDeviceState:
     is_swing_on: bool
     error_code: int
     is_on: bool
+    # Memoized to_cloud_format() result; LocalApi reuses the same instance
+    # across polls while a unit's record is unchanged
+    _cloud_format: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_cloud_format(self) -> dict[str, Any]:
-        """Convert local state to cloud-compatible dict for merging."""
-        mode = LOCAL_MODE_TO_CLOUD.get(self.ac_mode, MODE_AUTO)
-        wind = LOCAL_FAN_TO_CLOUD.get(self.fan_mode, WIND_AUTO)
-        power = POWER_OFF if not self.is_on else POWER_ON
+        """Convert local state to cloud-compatible dict for merging.
 
-        return {
-            "power": power,
-            "mode": mode or MODE_AUTO,
-            "setTemp": str(self.temperature_setpoint),
-            "wind": wind,
-            "factTemp": str(self.temperature),
-            "swing": "1" if self.is_swing_on else "0",
-        }
+        The dict is built once per instance and shared; do not mutate it.
+        """
+        cloud_format = self._cloud_format
+        if cloud_format is None:
+            cloud_format = {
+                "power": _POWER_BY_FLAG[self.is_on],
+                "mode": LOCAL_MODE_TO_CLOUD[self.ac_mode & 7],
+                "setTemp": str(self.temperature_setpoint),
+                "wind": LOCAL_FAN_TO_CLOUD[self.fan_mode & 7],
+                "factTemp": str(self.temperature),
+                "swing": _SWING_BY_FLAG[self.is_swing_on],
+            }
+            # The dataclass is frozen, so set the memo slot directly
+            object.__setattr__(self, "_cloud_format", cloud_format)
+        return cloud_format
+
+
+# Size in bytes of one CCM21-i status record
+RECORD_SIZE = 7
+
+
+def _decode_block(addrs: list[int], raw: bytes) -> list[LocalDeviceState]:
+    """Decode consecutive 7-byte status records from one contiguous buffer.
+
+    Record i (for addrs[i]) starts at offset i * RECORD_SIZE in raw.
+    """
+    view = memoryview(raw)
+    states: list[LocalDeviceState] = []
+    for i, addr in enumerate(addrs):
+        offset = i * RECORD_SIZE
+        # Load the record as one little-endian integer: byte n sits at bit 8n
+        word = int.from_bytes(view[offset : offset + RECORD_SIZE], "little")
+
+        # Byte 3: ac_mode and fan_mode
+        ac_mode = (word >> 26) & 7
+        fan_mode = (word >> 29) & 7
+
+        # Byte 4: swing and setpoint
+        is_swing_on = (word >> 33) & 1 != 0
+        temperature_setpoint = (word >> 35) & 0x1F
+
+        # Byte 2: error code
+        error_code = (word >> 18) & 0x3F
+
+        # Byte 6: current temperature (signed, sign-extended without branching)
+        byte6 = (word >> 48) & 0xFF
+        temperature = byte6 - ((byte6 & 0x80) << 1)
+
+        # Determine power state: mode 4 = OFF
+        is_on = ac_mode != LOCAL_MODE_OFF
+
+        states.append(
+            LocalDeviceState(
+                addr=addr,
+                ac_mode=ac_mode,
+                fan_mode=fan_mode,
+                temperature=temperature,
+                temperature_setpoint=temperature_setpoint,
+                is_swing_on=is_swing_on,
+                error_code=error_code,
+                is_on=is_on,
+            )
+        )
+    return states
 
 
-def parse_hex_status(addr: int, hex_data: str) -> LocalDeviceState | None:
-    """Parse 7-byte hex string from CCM21-i into a LocalDeviceState."""
-    if hex_data == "-" or len(hex_data) < 14:
+def _hex_to_record(addr: int, hex_data: str) -> bytes | None:
+    """Convert a CCM21-i hex string to its 7-byte record, or None if invalid."""
+    if hex_data == "-" or len(hex_data) < 2 * RECORD_SIZE:
         return None
 
-    hex_clean = hex_data.strip(",").strip()
+    # Bare 14-char records are the norm; only strip padded input
+    if len(hex_data) == 2 * RECORD_SIZE:
+        hex_clean = hex_data
+    else:
+        hex_clean = hex_data.strip(",").strip()
     try:
         raw = bytes.fromhex(hex_clean)
     except ValueError:
         _LOGGER.warning("Invalid hex data for addr %d: %s", addr, hex_data)
         return None
 
-    if len(raw) < 7:
+    if len(raw) < RECORD_SIZE:
         return None
 
-    # Byte 3: ac_mode and fan_mode
-    byte3 = raw[3]
-    ac_mode = (byte3 >> 2) & 7
-    fan_mode = (byte3 >> 5) & 7
-    is_on = (byte3 & 1) != 0 or ac_mode != LOCAL_MODE_OFF
-
-    # Byte 4: swing and setpoint
-    byte4 = raw[4]
-    is_swing_on = (byte4 >> 1) & 1 != 0
-    temperature_setpoint = (byte4 >> 3) & 0x1F
-
-    # Byte 2: error code
-    byte2 = raw[2]
-    error_code = (byte2 >> 2) & 0x3F
-
-    # Byte 6: current temperature (signed)
-    byte6 = raw[6]
-    temperature = byte6 if byte6 < 128 else byte6 - 256
-
-    # Determine power state: mode 4 = OFF
-    is_on = ac_mode != LOCAL_MODE_OFF
-
-    return LocalDeviceState(
-        addr=addr,
-        ac_mode=ac_mode,
-        fan_mode=fan_mode,
-        temperature=temperature,
-        temperature_setpoint=temperature_setpoint,
-        is_swing_on=is_swing_on,
-        error_code=error_code,
-        is_on=is_on,
-    )
+    return raw[:RECORD_SIZE]
+
+
+def _hex_rows_to_block(rows: list[tuple[int, str]]) -> tuple[list[int], bytes]:
+    """Convert (addr, hex) rows into the addrs and buffer of their valid records.
+
+    Rows are normally bare 14-char hex strings, so the whole batch is
+    converted with a single bytes.fromhex call. If any row is padded or
+    malformed, fall back to validating each row individually.
+    """
+    if all(len(hex_data) == 2 * RECORD_SIZE for _, hex_data in rows):
+        try:
+            raw = bytes.fromhex("".join(hex_data for _, hex_data in rows))
+        except ValueError:
+            raw = b""
+        if len(raw) == RECORD_SIZE * len(rows):
+            return [addr for addr, _ in rows], raw
+
+    addrs: list[int] = []
+    records: list[bytes] = []
+    for addr, hex_data in rows:
+        record = _hex_to_record(addr, hex_data)
+        if record is not None:
+            addrs.append(addr)
+            records.append(record)
+    return addrs, b"".join(records)
 
 
 class LocalApi:
@@ -154,46 +205,35 @@ class LocalApi:
     def __init__(
         self,
         host: str,
-        session: aiohttp.ClientSession | None = None,
+        session: aiohttp.ClientSession,
     ) -> None:
         """Initialize the local API client."""
         self._host = host
         self._session = session
-        self._owns_session = session is None
-
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure we have an aiohttp session."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-            self._owns_session = True
-        return self._session
-
-    async def close(self) -> None:
-        """Close the session if we own it."""
-        if self._owns_session and self._session and not self._session.closed:
-            await self._session.close()
+        # Last hex data and decoded state per addr, to skip unchanged rows
+        self._prev_hex: dict[int, str] = {}
+        self._prev_state: dict[int, LocalDeviceState] = {}
 
     async def _fetch_one_page(self) -> list[dict[str, Any]]:
         """Fetch one page of data from the local endpoint."""
-        session = await self._ensure_session()
         url = f"http://{self._host}{LOCAL_STATUS_ENDPOINT}"
 
-        async with session.post(
+        async with self._session.post(
             url,
             data={"_web_cmd": "get_mbdata_all", "_ajax": "1"},
-            timeout=aiohttp.ClientTimeout(total=10),
+            timeout=_LOCAL_TIMEOUT,
         ) as resp:
             if resp.status != 200:
                 _LOGGER.warning("Local API returned HTTP %d", resp.status)
                 return []
-            return await resp.json(content_type=None)
+            return _json_loads(await resp.read())
 
-    async def get_status(self) -> list[LocalDeviceState]:
+    async def get_status(self) -> dict[int, LocalDeviceState]:
         """Fetch all AC statuses from the local CCM21-i device.
 
         The CCM21-i alternates between returning addresses 0-31 and 32-63
         on each call, so we make two consecutive requests to get all 64.
+        Returns the states keyed by local addr, in ascending addr order.
         """
         try:
             page1 = await self._fetch_one_page()
@@ -202,21 +242,38 @@ class LocalApi:
             _LOGGER.warning("Local API error: %s", err)
             raise
 
-        # Merge both pages, dedup by addr
-        all_entries: dict[int, str] = {}
-        for entry in page1 + page2:
-            addr = entry.get("addr")
-            hex_data = entry.get("Data", "-")
-            if addr is not None and hex_data != "-":
-                all_entries[addr] = hex_data
-
-        devices: list[LocalDeviceState] = []
-        for addr, hex_data in sorted(all_entries.items()):
-            state = parse_hex_status(addr, hex_data)
-            if state is not None:
-                devices.append(state)
-
-        _LOGGER.debug("Local poll found %d active AC units across 0-63", len(devices))
+        # Merge both pages, dedup by addr, dropping inactive ("-") addresses
+        all_entries: dict[int, str] = {
+            entry["addr"]: entry["Data"]
+            for entry in chain(page1, page2)
+            if entry.get("addr") is not None and entry.get("Data", "-") != "-"
+        }
+
+        rows = sorted(all_entries.items())
+
+        # Decode only rows whose hex changed since the last poll, gathering
+        # them into one buffer so they are decoded in a single pass
+        changed = [
+            (addr, hex_data)
+            for addr, hex_data in rows
+            if self._prev_hex.get(addr) != hex_data
+        ]
+        if changed:
+            addrs, raw = _hex_rows_to_block(changed)
+            for state in _decode_block(addrs, raw):
+                self._prev_hex[state.addr] = all_entries[state.addr]
+                self._prev_state[state.addr] = state
+
+        devices = {
+            addr: self._prev_state[addr]
+            for addr, hex_data in rows
+            if self._prev_hex.get(addr) == hex_data
+        }
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Local poll found %d active AC units across 0-63", len(devices)
+            )
         return devices
 
     async def test_connection(self) -> bool:
@@ -235,66 +292,40 @@ class AirControlBaseApi:
         self,
         email: str,
         password: str,
-        session: aiohttp.ClientSession | None = None,
+        session: aiohttp.ClientSession,
     ) -> None:
         """Initialize the API client."""
         self._email = email
         self._password = password
         self._session = session
         self._user_id: str | None = None
-        self._cookie: str | None = None
-        self._owns_session = session is None
-
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure we have an aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-            self._owns_session = True
-        return self._session
-
-    async def close(self) -> None:
-        """Close the session if we own it."""
-        if self._owns_session and self._session and not self._session.closed:
-            await self._session.close()
+        # Serializes re-logins; the version is bumped on every successful
+        # login so concurrent callers can tell someone already re-authenticated
+        self._auth_lock = asyncio.Lock()
+        self._auth_version = 0
+        # Latest pending control state per device id, sent on the next flush
+        self._pending_controls: dict[Any, dict[str, Any]] = {}
+        self._control_flush: asyncio.Task[dict[Any, BaseException]] | None = None
 
     async def login(self) -> bool:
         """Authenticate with aircontrolbase.com. Returns True on success."""
-        session = await self._ensure_session()
-
         data = {
             "account": self._email,
             "password": self._password,
         }
 
-        headers = {
-            "Accept": "application/json, text/plain, */*",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Connection": "keep-alive",
-        }
-
         try:
-            async with session.post(
-                f"{BASE_URL}{LOGIN_PATH}",
+            async with self._session.post(
+                _CLOUD_URLS[LOGIN_PATH],
                 data=data,
-                headers=headers,
+                headers=_JSON_HEADERS,
             ) as resp:
                 if resp.status != 200:
                     raise AuthenticationError(
                         f"Login failed with HTTP status {resp.status}"
                     )
 
-                # Extract session cookie
-                cookies = resp.headers.getall("Set-Cookie", [])
-                if cookies:
-                    self._cookie = cookies[0]
-                else:
-                    # Try from cookie jar
-                    for cookie in session.cookie_jar:
-                        if cookie.key:
-                            self._cookie = f"{cookie.key}={cookie.value}"
-                            break
-
-                response_data = await resp.json()
+                response_data = _json_loads(await resp.read())
 
                 if (
                     response_data
@@ -302,15 +333,22 @@ class AirControlBaseApi:
                     and "id" in response_data["result"]
                 ):
                     self._user_id = str(response_data["result"]["id"])
+                    self._auth_version += 1
                     _LOGGER.debug("Login successful, user_id: %s", self._user_id)
                     return True
 
                 _LOGGER.error("Login response missing user id: %s", response_data)
                 raise AuthenticationError("Login response missing user id")
 
-        except aiohttp.ClientError as err:
+        except (aiohttp.ClientError, ValueError) as err:
             raise AirControlBaseApiError(f"Connection error during login: {err}") from err
 
+    async def _relogin(self, seen_version: int) -> None:
+        """Log in, unless another caller already did since seen_version."""
+        async with self._auth_lock:
+            if self._auth_version == seen_version:
+                await self.login()
+
     async def _api_call(
         self,
         path: str,
@@ -318,40 +356,33 @@ class AirControlBaseApi:
         retry_on_expired: bool = True,
     ) -> dict[str, Any]:
         """Make an authenticated API call."""
-        if not self._user_id or not self._cookie:
-            await self.login()
-
-        session = await self._ensure_session()
+        auth_version = self._auth_version
+        if not self._user_id:
+            await self._relogin(auth_version)
+            auth_version = self._auth_version
 
         post_data: dict[str, Any] = {"userId": self._user_id}
         if data:
             post_data.update(data)
 
-        headers = {
-            "Accept": "application/json, text/plain, */*",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Connection": "keep-alive",
-            "Cookie": self._cookie or "",
-        }
-
         try:
-            async with session.post(
-                f"{BASE_URL}{path}",
+            async with self._session.post(
+                _CLOUD_URLS[path],
                 data=post_data,
-                headers=headers,
+                headers=_JSON_HEADERS,
             ) as resp:
                 if resp.status != 200:
                     raise AirControlBaseApiError(
                         f"API call to {path} failed with HTTP {resp.status}"
                     )
 
-                response_data = await resp.json()
+                response_data = _json_loads(await resp.read())
 
                 # Handle session expired
                 if response_data.get("code") == SESSION_EXPIRED_CODE:
                     if retry_on_expired:
                         _LOGGER.debug("Session expired, re-authenticating")
-                        await self.login()
+                        await self._relogin(auth_version)
                         return await self._api_call(
                             path, data, retry_on_expired=False
                         )
@@ -359,7 +390,7 @@ class AirControlBaseApi:
 
                 return response_data
 
-        except aiohttp.ClientError as err:
+        except (aiohttp.ClientError, ValueError) as err:
             raise AirControlBaseApiError(
                 f"Connection error calling {path}: {err}"
             ) from err
@@ -374,26 +405,57 @@ class AirControlBaseApi:
         """
         response = await self._api_call(DETAILS_PATH)
 
-        devices: list[dict[str, Any]] = []
         result = response.get("result")
         if not result:
             _LOGGER.warning("No result in device response: %s", response)
-            return devices
+            return []
 
-        areas = result.get("areas", [])
-        for area in areas:
-            area_devices = area.get("data", [])
-            for device in area_devices:
-                devices.append(device)
+        areas = result.get("areas", ())
+        devices: list[dict[str, Any]] = list(
+            chain.from_iterable(area.get("data", ()) for area in areas)
+        )
 
-        _LOGGER.debug("Found %d devices", len(devices))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Found %d devices", len(devices))
         return devices
 
     async def control_device(self, device_state: dict[str, Any]) -> None:
         """Send a control command to a device.
 
         device_state should be a full device dict including the 'id' field.
+        Commands issued within CONTROL_BATCH_SECONDS of each other are
+        batched: only the latest state per device is sent, and every caller
+        waits for the same flush but only sees the error for its own device.
         """
+        device_id = device_state.get("id")
+        self._pending_controls[device_id] = device_state
+        if self._control_flush is None:
+            self._control_flush = asyncio.create_task(self._flush_controls())
+        errors = await asyncio.shield(self._control_flush)
+        if device_id in errors:
+            raise errors[device_id]
+
+    async def _flush_controls(self) -> dict[Any, BaseException]:
+        """Send the pending control commands once the batch window closes.
+
+        Returns the error for each device whose command failed.
+        """
+        await asyncio.sleep(CONTROL_BATCH_SECONDS)
+        pending = self._pending_controls
+        self._pending_controls = {}
+        self._control_flush = None
+        results = await asyncio.gather(
+            *(self._send_control(state) for state in pending.values()),
+            return_exceptions=True,
+        )
+        return {
+            device_id: result
+            for device_id, result in zip(pending, results)
+            if isinstance(result, BaseException)
+        }
+
+    async def _send_control(self, device_state: dict[str, Any]) -> None:
+        """Send one device state to the control endpoint."""
         control_json = json.dumps(device_state)
 
         data = {
@@ -402,14 +464,15 @@ class AirControlBaseApi:
         }
 
         await self._api_call(CONTROL_PATH, data)
-        _LOGGER.debug(
-            "Controlled device %s: mode=%s, temp=%s, wind=%s, power=%s",
-            device_state.get("id"),
-            device_state.get("mode"),
-            device_state.get("setTemp"),
-            device_state.get("wind"),
-            device_state.get("power"),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Controlled device %s: mode=%s, temp=%s, wind=%s, power=%s",
+                device_state.get("id"),
+                device_state.get("mode"),
+                device_state.get("setTemp"),
+                device_state.get("wind"),
+                device_state.get("power"),
+            )
 
     async def test_connection(self) -> bool:
         """Test the connection and credentials. Returns True on success."""
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 from typing import Any
 
@@ -49,7 +48,11 @@ CLOUD_TO_HVAC_MODE: dict[str, HVACMode] = {
     MODE_FAN: HVACMode.FAN_ONLY,
 }
 
-HVAC_MODE_TO_CLOUD: dict[HVACMode, str] = {v: k for k, v in CLOUD_TO_HVAC_MODE.items()}
+# Keyed by the plain string values; HVACMode is a StrEnum, so its members
+# hash and compare as those strings and can be looked up directly
+HVAC_MODE_TO_CLOUD: dict[str, str] = {
+    v.value: k for k, v in CLOUD_TO_HVAC_MODE.items()
+}
 
 # Mapping from cloud API wind strings to HA fan modes
 CLOUD_TO_FAN_MODE: dict[str, str] = {
@@ -61,6 +64,9 @@ CLOUD_TO_FAN_MODE: dict[str, str] = {
 # Reverse mapping
 FAN_MODE_TO_CLOUD: dict[str, str] = {v: k for k, v in CLOUD_TO_FAN_MODE.items()}
 
+# Cloud API swing strings that mean swing is off
+SWING_OFF_VALUES = frozenset({"0", "off", "n", ""})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -122,25 +128,37 @@ class MideaMControlClimate(CoordinatorEntity[MideaMControlCoordinator], ClimateE
             via_device=(DOMAIN, "ccm21i"),
         )
         self._last_device_data: dict[str, Any] = device_data
-
-    @property
-    def _device_data(self) -> dict[str, Any]:
-        """Get latest device data from coordinator."""
-        if self.coordinator.data and self._device_id in self.coordinator.data:
-            return self.coordinator.data[self._device_id]
-        return self._last_device_data
+        self._last_available = coordinator.last_update_success
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data and self._device_id in self.coordinator.data:
-            self._last_device_data = self.coordinator.data[self._device_id]
+        """Handle updated data from the coordinator.
+
+        The device's entry is looked up once here and cached, so the state
+        properties read it without touching the coordinator. The state is
+        only written when this device's data or the availability changed.
+        """
+        data = (
+            self.coordinator.data.get(self._device_id)
+            if self.coordinator.data
+            else None
+        )
+        available = self.coordinator.last_update_success
+        if available == self._last_available and (
+            data is None
+            or data is self._last_device_data
+            or data == self._last_device_data
+        ):
+            return
+        self._last_available = available
+        if data is not None:
+            self._last_device_data = data
         self.async_write_ha_state()
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
-        data = self._device_data
+        data = self._last_device_data
         power = data.get("power", POWER_OFF)
         if power != POWER_ON:
             return HVACMode.OFF
@@ -150,7 +168,7 @@ class MideaMControlClimate(CoordinatorEntity[MideaMControlCoordinator], ClimateE
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        data = self._device_data
+        data = self._last_device_data
         fact_temp = data.get("factTemp")
         if fact_temp is not None:
             try:
@@ -162,7 +180,7 @@ class MideaMControlClimate(CoordinatorEntity[MideaMControlCoordinator], ClimateE
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        data = self._device_data
+        data = self._last_device_data
         set_temp = data.get("setTemp")
         if set_temp is not None:
             try:
@@ -174,27 +192,35 @@ class MideaMControlClimate(CoordinatorEntity[MideaMControlCoordinator], ClimateE
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan mode."""
-        data = self._device_data
+        data = self._last_device_data
         cloud_wind = data.get("wind", WIND_LOW)
         return CLOUD_TO_FAN_MODE.get(cloud_wind, FAN_LOW)
 
     @property
     def swing_mode(self) -> str | None:
         """Return the current swing mode."""
-        data = self._device_data
+        data = self._last_device_data
         swing = data.get("swing", "")
         # The cloud API returns swing state as a string
-        if swing and swing not in ("0", "off", "n", ""):
-            return SWING_ON
-        return SWING_OFF
+        if not swing or swing in SWING_OFF_VALUES:
+            return SWING_OFF
+        return SWING_ON
 
     async def _send_control(self, **overrides: Any) -> None:
         """Build a device state dict and send it via cloud API."""
+        # Nothing would change: skip the round-trip and the poll cooldown.
+        # Not during a cooldown, though: an earlier command may still be in
+        # flight, so the cached data may not reflect the last request and a
+        # revert to it must still be sent.
+        current = self._last_device_data
+        if not self.coordinator.in_cooldown and all(
+            current.get(key) == value for key, value in overrides.items()
+        ):
+            return
+
         # Use cached cloud data as base (has all fields the API expects)
-        state = self.coordinator.get_cloud_device_data(self._device_id)
-        if not state:
-            state = copy.deepcopy(self._device_data)
-        state.update(overrides)
+        base = self.coordinator.peek_cloud_device_data(self._device_id)
+        state = {**(base or self._last_device_data), **overrides}
 
         # Start cooldown BEFORE sending so polls don't overwrite
         self.coordinator.notify_command_sent()
@@ -202,11 +228,15 @@ class MideaMControlClimate(CoordinatorEntity[MideaMControlCoordinator], ClimateE
         await self.coordinator.cloud_api.control_device(state)
 
         # Optimistically update local state - this stays visible
-        # for 15 seconds until the cooldown expires and real data is polled
+        # for 15 seconds until the cooldown expires and real data is polled.
+        # Publishing through the coordinator updates every entity of the
+        # device (climate, power switch, sensor) in one fan-out.
         if self.coordinator.data:
             self.coordinator.data[self._device_id] = state
-        self._last_device_data = state
-        self.async_write_ha_state()
+            self.coordinator.async_set_updated_data(self.coordinator.data)
+        else:
+            self._last_device_data = state
+            self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode."""
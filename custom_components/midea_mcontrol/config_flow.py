@@ -7,7 +7,14 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .aircontrolbase import (
@@ -16,7 +23,17 @@ from .aircontrolbase import (
     AuthenticationError,
     LocalApi,
 )
-from .const import CONF_EMAIL, CONF_HOST, CONF_PASSWORD, DOMAIN
+from .const import (
+    CONF_EMAIL,
+    CONF_HOST,
+    CONF_PASSWORD,
+    DEFAULT_CLOUD_SCAN_INTERVAL,
+    DEFAULT_LOCAL_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_CLOUD_SCAN_INTERVAL,
+    MIN_LOCAL_SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +51,12 @@ class MideaMControlConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow for this handler."""
+        return MideaMControlOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -52,13 +75,12 @@ class MideaMControlConfigFlow(ConfigFlow, domain=DOMAIN):
             session = async_get_clientsession(self.hass)
 
             # Test cloud credentials
-            api = AirControlBaseApi(
-                email=email,
-                password=password,
-                session=session,
-            )
-
             try:
+                api = AirControlBaseApi(
+                    email=email,
+                    password=password,
+                    session=session,
+                )
                 success = await api.test_connection()
                 if not success:
                     errors["base"] = "invalid_auth"
@@ -95,3 +117,39 @@ class MideaMControlConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class MideaMControlOptionsFlow(OptionsFlow):
+    """Handle options for Midea M-Control."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling interval."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        # Cloud-only entries get a higher floor to spare the vendor cloud
+        if self.config_entry.data.get(CONF_HOST):
+            default_interval = DEFAULT_LOCAL_SCAN_INTERVAL
+            min_interval = MIN_LOCAL_SCAN_INTERVAL
+        else:
+            default_interval = DEFAULT_CLOUD_SCAN_INTERVAL
+            min_interval = MIN_CLOUD_SCAN_INTERVAL
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_SCAN_INTERVAL, default_interval
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=min_interval, max=MAX_SCAN_INTERVAL),
+                    ),
+                }
+            ),
+        )
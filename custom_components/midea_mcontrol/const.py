@@ -14,8 +14,14 @@ CONTROL_PATH = "/web/device/control"
 
 SESSION_EXPIRED_CODE = 40018
 
+# Control commands issued within this window are coalesced into one flush
+CONTROL_BATCH_SECONDS = 0.15
+
 DEFAULT_CLOUD_SCAN_INTERVAL = 60  # seconds (cloud fallback)
 DEFAULT_LOCAL_SCAN_INTERVAL = 5   # seconds (local fast polling)
+MIN_LOCAL_SCAN_INTERVAL = 5       # seconds (lowest interval with a local gateway)
+MIN_CLOUD_SCAN_INTERVAL = 30      # seconds (lowest interval when cloud-only)
+MAX_SCAN_INTERVAL = 3600          # seconds (highest user-configurable interval)
 
 LOCAL_STATUS_ENDPOINT = "/get_mbdata_all.jsn"
 
@@ -53,3 +59,30 @@ LOCAL_FAN_LOW = 2
 LOCAL_FAN_MEDIUM = 3
 LOCAL_FAN_HIGH = 4
 LOCAL_FAN_OFF = 5
+
+# Map local integer modes (3-bit field) to cloud mode strings, indexed by
+# mode. Off is represented by power="n", so it and unknown modes map to auto.
+LOCAL_MODE_TO_CLOUD: tuple[str, ...] = tuple(
+    {
+        LOCAL_MODE_COOL: MODE_COOL,
+        LOCAL_MODE_HEAT: MODE_HEAT,
+        LOCAL_MODE_DRY: MODE_DRY,
+        LOCAL_MODE_FAN: MODE_FAN,
+        LOCAL_MODE_OFF: MODE_AUTO,
+        LOCAL_MODE_AUTO: MODE_AUTO,
+    }.get(mode, MODE_AUTO)
+    for mode in range(8)
+)
+
+# Map local integer fan (3-bit field) to cloud wind strings, indexed by fan.
+# Off and unknown speeds map to auto.
+LOCAL_FAN_TO_CLOUD: tuple[str, ...] = tuple(
+    {
+        LOCAL_FAN_AUTO: WIND_AUTO,
+        LOCAL_FAN_LOW: WIND_LOW,
+        LOCAL_FAN_MEDIUM: WIND_MID,
+        LOCAL_FAN_HIGH: WIND_HIGH,
+        LOCAL_FAN_OFF: WIND_AUTO,
+    }.get(fan, WIND_AUTO)
+    for fan in range(8)
+)
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timedelta
 import logging
+import random
 import time
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -20,8 +25,9 @@ from .aircontrolbase import (
 from .const import DEFAULT_CLOUD_SCAN_INTERVAL, DEFAULT_LOCAL_SCAN_INTERVAL, DOMAIN
 
 # Refresh cloud cache every 5 minutes even when local polling is active,
-# to prevent stale cache data from being shown when local fails.
-CLOUD_CACHE_REFRESH_SECONDS = 300
+# to prevent stale cache data from being shown when local fails. This runs
+# on its own timer (see async_setup_entry), independent of the local polls.
+CLOUD_CACHE_REFRESH_INTERVAL = timedelta(minutes=5)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +35,29 @@ _LOGGER = logging.getLogger(__name__)
 # to prevent the old state from overwriting the optimistic update.
 COMMAND_COOLDOWN_SECONDS = 15
 
+# Returned by peek_cloud_device_data for devices without cached cloud data
+_NO_CLOUD_DATA: Mapping[str, Any] = MappingProxyType({})
+
+# While local polling keeps failing, fall back to the cloud at most this
+# often: the delay doubles per failure up to the max, plus random jitter
+CLOUD_FALLBACK_BACKOFF_SECONDS = 60
+CLOUD_FALLBACK_BACKOFF_MAX_SECONDS = 600
+CLOUD_FALLBACK_JITTER_SECONDS = 5
+
+# In cloud-only polling, keep showing the last data through cloud errors
+# for at most this long before marking the entities unavailable
+CLOUD_ERROR_GRACE_SECONDS = 120
+
+
+def _retrieve_task_result(task: asyncio.Task[Any]) -> None:
+    """Mark a shared fetch's outcome as retrieved.
+
+    The waiters re-raise any error; this only keeps asyncio from logging
+    "Task exception was never retrieved" when every waiter was cancelled.
+    """
+    if not task.cancelled():
+        task.exception()
+
 
 class MideaMControlCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
     """Coordinator that polls locally for fast status and uses cloud for control.
@@ -45,13 +74,14 @@ class MideaMControlCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
         hass: HomeAssistant,
         cloud_api: AirControlBaseApi,
         local_api: LocalApi | None = None,
+        scan_interval: int | None = None,
     ) -> None:
         """Initialize the coordinator."""
         self._local_api = local_api
         self.cloud_api = cloud_api
 
-        # Use fast interval if local, slower if cloud-only
-        interval = (
+        # Use the configured interval, else fast if local, slower if cloud-only
+        interval = scan_interval or (
             DEFAULT_LOCAL_SCAN_INTERVAL
             if local_api
             else DEFAULT_CLOUD_SCAN_INTERVAL
@@ -62,161 +92,224 @@ class MideaMControlCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=interval),
+            always_update=False,
         )
 
         # Mapping: cloud device ID -> local addr (built during initial cloud fetch)
         self._id_to_addr: dict[str, int] = {}
-        # Store cloud device data for control operations (preserves all fields)
+        # Inverse mapping: local addr -> cloud device ID
+        self._addr_to_id: dict[int, str] = {}
+        # Store cloud device data for control operations (preserves all fields).
+        # Replaced wholesale by each cloud fetch; in cloud-only mode it is the
+        # same dict the coordinator publishes as its data.
         self._cloud_device_cache: dict[str, dict[str, Any]] = {}
-        # Track last command time to avoid overwriting optimistic state
-        self._last_command_time: float = 0
-        # Track last cloud cache refresh to keep cache fresh
-        self._last_cloud_refresh: float = 0
-        # Count consecutive local failures for logging
+        # Per-poll merge plan: local addr -> (cloud device ID, cached cloud data).
+        # Rebuilt whenever the mapping or the cloud cache changes.
+        self._merge_plan: dict[int, tuple[str, dict[str, Any]]] = {}
+        # Set during the post-command cooldown to avoid overwriting optimistic
+        # state; cleared by a loop timer when the cooldown ends
+        self._in_cooldown: bool = False
+        self._cooldown_handle: asyncio.TimerHandle | None = None
+        # Count consecutive local failures for logging and fallback backoff
         self._local_fail_count: int = 0
+        # Cloud fallbacks made during the current local outage, and the
+        # monotonic time before which a failed local poll won't hit the cloud
+        self._cloud_fallback_count: int = 0
+        self._next_cloud_fallback: float = 0
+        # Monotonic time of the first cloud error in the current outage
+        # (0 when the last cloud poll succeeded)
+        self._cloud_failing_since: float = 0
+        # Poll path: cloud until an addr mapping exists, then local
+        # (set by _build_addr_mapping)
+        self._update_fn: Callable[[], Awaitable[dict[str, dict[str, Any]]]] = (
+            self._poll_cloud
+        )
+        # The fetch currently in flight, shared by overlapping refreshes
+        self._update_task: asyncio.Task[dict[str, dict[str, Any]]] | None = None
 
     @property
     def has_local(self) -> bool:
         """Return True if local polling is configured."""
         return self._local_api is not None
 
+    @property
+    def in_cooldown(self) -> bool:
+        """Return True during the cooldown that follows a control command."""
+        return self._in_cooldown
+
     def notify_command_sent(self) -> None:
         """Record that a control command was just sent.
 
         This starts a cooldown period during which polls are skipped
-        so the optimistic state is preserved.
+        so the optimistic state is preserved. A new command restarts it.
         """
-        self._last_command_time = time.monotonic()
+        if self._cooldown_handle is not None:
+            self._cooldown_handle.cancel()
+        self._in_cooldown = True
+        self._cooldown_handle = self.hass.loop.call_later(
+            COMMAND_COOLDOWN_SECONDS, self._clear_cooldown
+        )
 
-    def _in_cooldown(self) -> bool:
-        """Return True if we're in the post-command cooldown period."""
-        if self._last_command_time == 0:
-            return False
-        elapsed = time.monotonic() - self._last_command_time
-        return elapsed < COMMAND_COOLDOWN_SECONDS
+    def _clear_cooldown(self) -> None:
+        """End the post-command cooldown."""
+        self._in_cooldown = False
+        self._cooldown_handle = None
 
     async def async_initial_cloud_fetch(self) -> dict[str, dict[str, Any]]:
         """Fetch initial cloud data and build addr mapping.
 
         Must be called once during setup before the first local poll.
+        The cloud and local gateway are queried concurrently.
         """
+        local_states: dict[int, LocalDeviceState] = {}
         try:
-            devices = await self.cloud_api.get_devices()
+            if self._local_api:
+                devices, local_states = await asyncio.gather(
+                    self.cloud_api.get_devices(), self._local_api.get_status()
+                )
+            else:
+                devices = await self.cloud_api.get_devices()
         except AirControlBaseApiError as err:
             raise UpdateFailed(f"Error fetching cloud data: {err}") from err
 
-        result: dict[str, dict[str, Any]] = {}
-        for device in devices:
-            if "id" in device:
-                device_id = device["id"]
-                result[device_id] = device
-                self._cloud_device_cache[device_id] = device
+        result = {device["id"]: device for device in devices if "id" in device}
+        self._store_cloud_devices(result)
 
         # Build addr mapping if local is available
         if self._local_api:
-            await self._build_addr_mapping(result)
+            self._build_addr_mapping(result, local_states)
 
         return result
 
-    async def _build_addr_mapping(
-        self, cloud_devices: dict[str, dict[str, Any]]
+    def _build_addr_mapping(
+        self,
+        cloud_devices: dict[str, dict[str, Any]],
+        local_states: dict[int, LocalDeviceState],
     ) -> None:
         """Build mapping between cloud IDs and local addresses.
 
         Matches by comparing setTemp and factTemp between cloud and local.
+        local_states must be in ascending addr order, as returned by
+        LocalApi.get_status.
         """
-        if not self._local_api:
-            return
-
-        local_states = await self._local_api.get_status()
         if not local_states:
             _LOGGER.warning("No local devices found for addr mapping")
             return
 
-        cloud_list = list(cloud_devices.items())
-        local_list = sorted(local_states, key=lambda x: x.addr)
+        # Strategy 1: Match by temperature values, via an index of the local
+        # states (in addr order) keyed by their stringified temperatures.
+        # Unmatched devices on both sides are tracked during the same walks:
+        # cloud IDs as they miss, local states (by addr, in addr order) until
+        # they are matched.
+        unmatched_cloud: list[str] = []
+        unmatched_local: dict[int, LocalDeviceState] = {}
 
-        # Strategy 1: Match by temperature values
-        matched_cloud: set[str] = set()
-        matched_local: set[int] = set()
-
-        for device_id, cloud_data in cloud_list:
-            cloud_temp = cloud_data.get("factTemp")
-            cloud_set = cloud_data.get("setTemp")
-
-            for local_state in local_list:
-                if local_state.addr in matched_local:
-                    continue
-
-                local_temp = str(local_state.temperature)
-                local_set = str(local_state.temperature_setpoint)
+        local_by_temp: defaultdict[tuple[str, str], deque[LocalDeviceState]] = (
+            defaultdict(deque)
+        )
+        for local_state in local_states.values():
+            key = (str(local_state.temperature), str(local_state.temperature_setpoint))
+            local_by_temp[key].append(local_state)
+            unmatched_local[local_state.addr] = local_state
+
+        for device_id, cloud_data in cloud_devices.items():
+            bucket = local_by_temp.get(
+                (cloud_data.get("factTemp"), cloud_data.get("setTemp"))
+            )
+            if not bucket:
+                unmatched_cloud.append(device_id)
+                continue
 
-                if cloud_temp == local_temp and cloud_set == local_set:
-                    self._id_to_addr[device_id] = local_state.addr
-                    matched_cloud.add(device_id)
-                    matched_local.add(local_state.addr)
-                    _LOGGER.debug(
-                        "Mapped cloud ID %s -> local addr %d (by temp match)",
-                        device_id,
-                        local_state.addr,
-                    )
-                    break
+            local_state = bucket.popleft()
+            self._id_to_addr[device_id] = local_state.addr
+            self._addr_to_id[local_state.addr] = device_id
+            del unmatched_local[local_state.addr]
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Mapped cloud ID %s -> local addr %d (by temp match)",
+                    device_id,
+                    local_state.addr,
+                )
 
         # Strategy 2: Match remaining by order
-        unmatched_cloud = [
-            (did, d) for did, d in cloud_list if did not in matched_cloud
-        ]
-        unmatched_local = [s for s in local_list if s.addr not in matched_local]
-
-        for (device_id, _), local_state in zip(unmatched_cloud, unmatched_local):
+        for device_id, local_state in zip(unmatched_cloud, unmatched_local.values()):
             self._id_to_addr[device_id] = local_state.addr
-            _LOGGER.debug(
-                "Mapped cloud ID %s -> local addr %d (by order)",
-                device_id,
-                local_state.addr,
-            )
+            self._addr_to_id[local_state.addr] = device_id
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Mapped cloud ID %s -> local addr %d (by order)",
+                    device_id,
+                    local_state.addr,
+                )
 
         _LOGGER.info(
             "Address mapping complete: %d devices mapped", len(self._id_to_addr)
         )
+        self._rebuild_merge_plan()
+        if self._id_to_addr:
+            self._update_fn = self._update_from_local
+
+    def _rebuild_merge_plan(self) -> None:
+        """Pair each mapped local addr with its device ID and cached cloud data."""
+        cache = self._cloud_device_cache
+        self._merge_plan = {
+            addr: (device_id, cache.get(device_id, {}))
+            for addr, device_id in self._addr_to_id.items()
+        }
 
     async def _async_update_data(self) -> dict[str, dict[str, Any]]:
         """Fetch data - locally if available, cloud as fallback.
 
+        Refreshes that overlap (e.g. a scheduled poll and a requested one)
+        wait for the same fetch instead of each starting their own. The
+        fetch runs as a background task of the config entry, so it is
+        cancelled when the entry unloads.
+        """
+        task = self._update_task
+        # The task may already be done: it can finish eagerly when started
+        if task is None or task.done():
+            task = self._update_task = (
+                self.config_entry.async_create_background_task(
+                    self.hass, self._async_fetch_data(), f"{DOMAIN} poll"
+                )
+            )
+            task.add_done_callback(_retrieve_task_result)
+        return await asyncio.shield(task)
+
+    async def _async_fetch_data(self) -> dict[str, dict[str, Any]]:
+        """Run one shared fetch for _async_update_data.
+
         Skips polling during cooldown after a command to preserve
         the optimistic state shown in the UI.
         """
-        if self._in_cooldown():
-            _LOGGER.debug(
-                "Skipping poll (%.0fs remaining in cooldown)",
-                COMMAND_COOLDOWN_SECONDS
-                - (time.monotonic() - self._last_command_time),
-            )
+        if self._in_cooldown:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Skipping poll (%.0fs remaining in cooldown)",
+                    self._cooldown_handle.when() - self.hass.loop.time(),
+                )
             # Return current data unchanged
             return self.data or {}
 
-        # Periodically refresh cloud cache even when using local polling,
-        # so that if local fails we have recent cloud data to fall back on.
-        if self._local_api and self._id_to_addr:
-            await self._maybe_refresh_cloud_cache()
-            return await self._update_from_local()
-        return await self._update_from_cloud()
+        return await self._update_fn()
 
-    async def _maybe_refresh_cloud_cache(self) -> None:
-        """Refresh the cloud device cache periodically in the background."""
-        now = time.monotonic()
-        if now - self._last_cloud_refresh < CLOUD_CACHE_REFRESH_SECONDS:
-            return
+    async def async_refresh_cloud_cache(self, now: datetime | None = None) -> None:
+        """Refresh the cloud device cache on the slow cloud timer.
 
+        Keeps recent cloud data (names, lock values, etc.) to overlay local
+        status onto and to fall back on if local fails, without holding up
+        the fast local polls.
+        """
         try:
             devices = await self.cloud_api.get_devices()
-            for device in devices:
-                if "id" in device:
-                    self._cloud_device_cache[device["id"]] = device
-            self._last_cloud_refresh = now
-            _LOGGER.debug("Cloud cache refreshed (%d devices)", len(devices))
         except AirControlBaseApiError as err:
             _LOGGER.debug("Cloud cache refresh failed (non-critical): %s", err)
+            return
+
+        self._store_cloud_devices(
+            {device["id"]: device for device in devices if "id" in device}
+        )
+        _LOGGER.debug("Cloud cache refreshed (%d devices)", len(devices))
 
     async def _update_from_local(self) -> dict[str, dict[str, Any]]:
         """Fast update using local CCM21-i API."""
@@ -235,7 +328,7 @@ class MideaMControlCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
                     self._local_fail_count,
                     err,
                 )
-            return await self._update_from_cloud()
+            return await self._fallback_to_cloud()
 
         if not local_states:
             self._local_fail_count += 1
@@ -243,7 +336,7 @@ class MideaMControlCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
                 _LOGGER.warning(
                     "Local poll returned no devices, falling back to cloud"
                 )
-            return await self._update_from_cloud()
+            return await self._fallback_to_cloud()
 
         # Local poll succeeded — reset failure counter
         if self._local_fail_count > 0:
@@ -251,26 +344,75 @@ class MideaMControlCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
                 "Local poll recovered after %d failures", self._local_fail_count
             )
         self._local_fail_count = 0
-
-        # Build addr -> local state lookup
-        addr_to_state: dict[int, LocalDeviceState] = {
-            s.addr: s for s in local_states
-        }
+        self._cloud_fallback_count = 0
+        self._next_cloud_fallback = 0
 
         result: dict[str, dict[str, Any]] = {}
+        plan = self._merge_plan
+
+        # Walk the reported local states once, overlaying each onto its
+        # device's cached cloud data (which has id, name, lock values, etc.)
+        for addr, local_state in local_states.items():
+            planned = plan.get(addr)
+            if planned is None:
+                continue
+            device_id, cached = planned
+            result[device_id] = cached | local_state.to_cloud_format()
+
+        # Mapped devices the gateway didn't report keep their cached cloud data
+        if len(result) < len(plan):
+            for device_id, cached in plan.values():
+                if device_id not in result:
+                    result[device_id] = dict(cached)
+
+        return result
+
+    async def _fallback_to_cloud(self) -> dict[str, dict[str, Any]]:
+        """Fall back to the cloud after a failed local poll, with backoff.
 
-        for device_id, addr in self._id_to_addr.items():
-            # Start from cached cloud data (has id, name, lock values, etc.)
-            cached = self._cloud_device_cache.get(device_id, {})
-            device_data = dict(cached)
+        Between fallbacks the current data is kept, so a sustained local
+        outage doesn't poll the cloud at the local interval.
+        """
+        now = time.monotonic()
+        if self.data and now < self._next_cloud_fallback:
+            if not self.last_update_success:
+                # The last fallback failed too: stay failed until the retry
+                raise UpdateFailed(
+                    "Local poll failed and cloud fallback is backing off"
+                )
+            return self.data
 
-            # Overlay local status if available
-            local_state = addr_to_state.get(addr)
-            if local_state:
-                device_data.update(local_state.to_cloud_format())
+        backoff = min(
+            CLOUD_FALLBACK_BACKOFF_SECONDS * 2 ** min(self._cloud_fallback_count, 4),
+            CLOUD_FALLBACK_BACKOFF_MAX_SECONDS,
+        )
+        self._cloud_fallback_count += 1
+        self._next_cloud_fallback = (
+            now + backoff + random.uniform(0, CLOUD_FALLBACK_JITTER_SECONDS)
+        )
+        return await self._update_from_cloud()
 
-            result[device_id] = device_data
+    async def _poll_cloud(self) -> dict[str, dict[str, Any]]:
+        """Cloud-only poll that rides out brief cloud outages.
 
+        The last data is kept for up to CLOUD_ERROR_GRACE_SECONDS after the
+        first error; after that the error is raised as usual.
+        """
+        try:
+            result = await self._update_from_cloud()
+        except UpdateFailed as err:
+            now = time.monotonic()
+            if not self._cloud_failing_since:
+                self._cloud_failing_since = now
+            if (
+                self.data
+                and now - self._cloud_failing_since < CLOUD_ERROR_GRACE_SECONDS
+            ):
+                _LOGGER.debug("Keeping last data during cloud error: %s", err)
+                return self.data
+            raise
+
+        self._cloud_failing_since = 0
         return result
 
     async def _update_from_cloud(self) -> dict[str, dict[str, Any]]:
@@ -280,15 +422,39 @@ class MideaMControlCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
         except AirControlBaseApiError as err:
             raise UpdateFailed(f"Error fetching cloud data: {err}") from err
 
-        result: dict[str, dict[str, Any]] = {}
-        for device in devices:
-            if "id" in device:
-                device_id = device["id"]
-                result[device_id] = device
-                self._cloud_device_cache[device_id] = device
-
+        result = {device["id"]: device for device in devices if "id" in device}
+        self._store_cloud_devices(result)
         return result
 
-    def get_cloud_device_data(self, device_id: str) -> dict[str, Any]:
-        """Get the full cached cloud data for a device (for control commands)."""
-        return dict(self._cloud_device_cache.get(device_id, {}))
+    def _store_cloud_devices(self, devices: dict[str, dict[str, Any]]) -> None:
+        """Make a cloud fetch's devices (keyed by ID) the cloud device cache.
+
+        get_devices can return an empty or partial list without raising, so
+        an empty result leaves the cache untouched, and mapped devices missing
+        from a partial one keep their previous entry (which local polls and
+        control commands rely on for id, name and lock fields).
+        """
+        if not devices:
+            _LOGGER.debug("Cloud returned no devices, keeping cached data")
+            return
+
+        previous = self._cloud_device_cache
+        missing = {
+            device_id: previous[device_id]
+            for device_id in self._id_to_addr
+            if device_id not in devices and device_id in previous
+        }
+        self._cloud_device_cache = devices | missing if missing else devices
+        if self._merge_plan:
+            self._rebuild_merge_plan()
+
+    def peek_cloud_device_data(self, device_id: str) -> Mapping[str, Any]:
+        """Get the full cached cloud data for a device (for control commands).
+
+        Returns a read-only view of the cached dict rather than a copy; it is
+        empty when the device has no cached cloud data.
+        """
+        cached = self._cloud_device_cache.get(device_id)
+        if cached is None:
+            return _NO_CLOUD_DATA
+        return MappingProxyType(cached)
@@ -23,6 +23,16 @@ from .coordinator import MideaMControlCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
+def _parse_temperature(fact_temp: Any) -> float | None:
+    """Parse the cloud API's factTemp string, or None if missing/invalid."""
+    if fact_temp is not None:
+        try:
+            return float(fact_temp)
+        except (ValueError, TypeError):
+            return None
+    return None
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -69,29 +79,31 @@ class MideaMControlTemperatureSensor(
             via_device=(DOMAIN, "ccm21i"),
         )
         self._last_device_data: dict[str, Any] = device_data
-
-    @property
-    def _device_data(self) -> dict[str, Any]:
-        """Get latest device data from coordinator."""
-        if self.coordinator.data and self._device_id in self.coordinator.data:
-            return self.coordinator.data[self._device_id]
-        return self._last_device_data
+        self._last_available = coordinator.last_update_success
+        self._attr_native_value = _parse_temperature(device_data.get("factTemp"))
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data and self._device_id in self.coordinator.data:
-            self._last_device_data = self.coordinator.data[self._device_id]
+        """Handle updated data from the coordinator.
+
+        Most polls leave the room temperature unchanged, so the state is only
+        written when factTemp or the availability changed. The reading is
+        parsed here once per change, so native_value is a plain attribute.
+        """
+        data = (
+            self.coordinator.data.get(self._device_id)
+            if self.coordinator.data
+            else None
+        )
+        changed = False
+        if data is not None:
+            fact_temp = data.get("factTemp")
+            if fact_temp != self._last_device_data.get("factTemp"):
+                self._attr_native_value = _parse_temperature(fact_temp)
+                changed = True
+            self._last_device_data = data
+        available = self.coordinator.last_update_success
+        if not changed and available == self._last_available:
+            return
+        self._last_available = available
         self.async_write_ha_state()
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current temperature."""
-        data = self._device_data
-        fact_temp = data.get("factTemp")
-        if fact_temp is not None:
-            try:
-                return float(fact_temp)
-            except (ValueError, TypeError):
-                return None
-        return None
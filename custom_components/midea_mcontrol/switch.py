@@ -66,25 +66,34 @@ class MideaMControlPowerSwitch(
             via_device=(DOMAIN, "ccm21i"),
         )
         self._last_device_data: dict[str, Any] = device_data
-
-    @property
-    def _device_data(self) -> dict[str, Any]:
-        """Get latest device data from coordinator."""
-        if self.coordinator.data and self._device_id in self.coordinator.data:
-            return self.coordinator.data[self._device_id]
-        return self._last_device_data
+        self._last_available = coordinator.last_update_success
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data and self._device_id in self.coordinator.data:
-            self._last_device_data = self.coordinator.data[self._device_id]
+        """Handle updated data from the coordinator.
+
+        The state is only written when the power state or the availability
+        changed; other fields of the device don't affect this entity.
+        """
+        data = (
+            self.coordinator.data.get(self._device_id)
+            if self.coordinator.data
+            else None
+        )
+        changed = False
+        if data is not None:
+            changed = data.get("power") != self._last_device_data.get("power")
+            self._last_device_data = data
+        available = self.coordinator.last_update_success
+        if not changed and available == self._last_available:
+            return
+        self._last_available = available
         self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
         """Return True if the AC is on."""
-        return self._device_data.get("power") == POWER_ON
+        return self._last_device_data.get("power") == POWER_ON
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the AC on in Cool mode."""
@@ -96,17 +105,17 @@ class MideaMControlPowerSwitch(
 
     async def _send_control(self, **overrides: Any) -> None:
         """Send a control command via the cloud API."""
-        import copy
-
-        state = self.coordinator.get_cloud_device_data(self._device_id)
-        if not state:
-            state = copy.deepcopy(self._device_data)
-        state.update(overrides)
+        base = self.coordinator.peek_cloud_device_data(self._device_id)
+        state = {**(base or self._last_device_data), **overrides}
 
         self.coordinator.notify_command_sent()
         await self.coordinator.cloud_api.control_device(state)
 
+        # Publish through the coordinator so the device's climate entity
+        # picks up the optimistic state too
         if self.coordinator.data:
             self.coordinator.data[self._device_id] = state
-        self._last_device_data = state
-        self.async_write_ha_state()
+            self.coordinator.async_set_updated_data(self.coordinator.data)
+        else:
+            self._last_device_data = state
+            self.async_write_ha_state()